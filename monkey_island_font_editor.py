@@ -7,20 +7,72 @@ Preserves the original color palette (2 tones of pink) without modification.
 
 import sys
 import os
+import functools
+from collections import deque
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QScrollArea, QLabel, QPushButton, QFileDialog, QMessageBox, QGridLayout,
     QFrame, QSizePolicy, QButtonGroup
 )
-from PyQt6.QtCore import Qt, QSize, QRect, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, QRect, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import (
-    QImage, QPixmap, QPainter, QColor, QPen, QMouseEvent, QPaintEvent
+    QImage, QImageReader, QPixmap, QPixmapCache, QPainter, QColor, QPen,
+    QMouseEvent, QPaintEvent
 )
 from PIL import Image
 import struct
 
 
+# Application-wide rules, matched by objectName instead of per-widget stylesheets
+APP_STYLE = """
+    QPushButton#bitmapBtn {
+        font-size: 8px;
+        padding: 3px;
+        font-weight: bold;
+    }
+    QLabel#bitmapLabel {
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QLabel#sectionLabel {
+        font-weight: bold;
+        font-size: 12px;
+    }
+"""
+
+# Rules shared by every palette button; each button only adds its background color
+COLOR_BUTTON_STYLE = """
+    QPushButton {
+        border: none;
+        margin: 0px;
+        padding: 0px;
+    }
+    QPushButton:checked {
+        border: 2px solid #ffffff;
+    }
+    QPushButton:hover {
+        border: 1px solid #ffff00;
+    }
+"""
+
+# Default workspace: the folder this script lives in
+WORKSPACE_DIR = str(Path(__file__).resolve().parent)
+
+# Known font bitmaps: (filename, selector label, character set index)
+BITMAP_FILES = [
+    ("char0001.bmp", "Sentence Line and Dialog", 1),
+    ("char0002.bmp", "On Screen Text", 2),
+    ("char0003.bmp", "Upside Down Text", 3),
+    ("char0004.bmp", "Title Screen/Credits Text", 4),
+    ("char0006.bmp", "VERB UI", 6),
+]
+
+# Jump-table captions and tooltips depend only on the character index
+_ASCII_LABELS = [chr(i) if 32 <= i < 127 else str(i) for i in range(256)]
+_ASCII_TOOLTIPS = [f"Jump to ASCII {i}: '{chr(i)}'" for i in range(256)]
+
+
 class PixelEditorCanvas(QWidget):
     """Canvas widget for pixel-level editing with zoom and grid."""
     
@@ -37,17 +89,22 @@ class PixelEditorCanvas(QWidget):
         self.grid_enabled = True
         self.current_color_index = 1
         self.drawing = False
+        self._last_draw_pos = None  # Image coords of the previous stroke sample
+        self._pre_bits = None  # Buffer snapshot taken when the current stroke started
         self.char_height = 8  # Standard 8-pixel tall characters
         self.show_char_indices = True
         self.hover_y = -1
+        self._hover_update_pending = False
+        self._hover_painted_char = -1  # Character whose strip was last repainted as hovered
         self.ruler_width = 120  # Width of left ruler in pixels
         
         # Selection and clipboard
         self.selecting = False
         self.selection_start = None
         self.selection_end = None
-        self.clipboard_data = None  # Stores copied pixel data
+        self.clipboard_data = None  # Stores copied pixel data (bytes, row-major)
         self.clipboard_size = None  # (width, height)
+        self._clipboard_pixmap = None  # Paste preview, rendered with the current palette
         self.paste_mode = False
         self.paste_position = None  # Current paste preview position
         self.paste_dragging = False
@@ -56,9 +113,17 @@ class PixelEditorCanvas(QWidget):
         self.edit_mode = 'draw'
         
         # Undo/Redo history
-        self.undo_stack = []  # List of (pixel_data, description)
-        self.redo_stack = []  # List of (pixel_data, description)
         self.max_history = 50  # Maximum undo levels
+        # Bounded stacks of (delta, description, width, height); oldest entries drop off.
+        # A delta is a tuple of runs (start, old_bytes, new_bytes): consecutive buffer rows an action changed.
+        self.undo_stack = deque(maxlen=self.max_history)
+        self.redo_stack = deque(maxlen=self.max_history)
+        
+        # One grid cell (top and left edges), tiled over the canvas
+        self._grid_tile = None
+        # Writable view of the image buffer and its row stride, see _pixel_buffer()
+        self._bits_mv = None
+        self._stride = 0
         
         self.setMinimumSize(200, 200)
         self.setMouseTracking(True)
@@ -80,38 +145,24 @@ class PixelEditorCanvas(QWidget):
         width, height = pil_image.size
         
         # Auto-detect character height based on bitmap height
-        if height == 2048:  # 256 chars * 8
-            self.char_height = 8
-        elif height == 2259:  # 256 chars * 9
-            self.char_height = 9
-        elif height == 3390:  # 256 chars * 15
-            self.char_height = 15
-        elif height == 3584:  # 256 chars * 14
-            self.char_height = 14
-        else:
-            # Calculate by dividing by 256 (extended ASCII)
-            self.char_height = height // 256
-            if self.char_height < 1:
-                self.char_height = 8  # fallback
+        self.char_height = self.detect_char_height(height)
         
-        self.image = QImage(width, height, QImage.Format.Format_Indexed8)
+        # Copy pixel data in one go (PIL rows are tightly packed, one byte per pixel).
+        # QImage does not own the source buffer, so take a deep copy.
+        pixel_data = pil_image.tobytes()
+        self.image = QImage(pixel_data, width, height, width, QImage.Format.Format_Indexed8).copy()
+        self._bits_mv = None
+        self._clipboard_pixmap = None  # The clipboard may be pasted under a new palette
         
         # Set palette
         if self.original_palette:
             palette = self.original_palette[:768]  # RGB triplets
-            for i in range(256):
-                r = palette[i * 3] if i * 3 < len(palette) else 0
-                g = palette[i * 3 + 1] if i * 3 + 1 < len(palette) else 0
-                b = palette[i * 3 + 2] if i * 3 + 2 < len(palette) else 0
-                self.image.setColor(i, QColor(r, g, b).rgb())
-        
-        # Copy pixel data
-        pixel_data = pil_image.tobytes()
-        for y in range(height):
-            for x in range(width):
-                idx = y * width + x
-                if idx < len(pixel_data):
-                    self.image.setPixel(x, y, pixel_data[idx])
+            palette = palette + [0] * (768 - len(palette))
+            # Build opaque QRgb (0xAARRGGBB) values directly, no QColor per entry
+            self.image.setColorTable([
+                0xFF000000 | (palette[i * 3] << 16) | (palette[i * 3 + 1] << 8) | palette[i * 3 + 2]
+                for i in range(256)
+            ])
         
         self.update_size()
         self.update()
@@ -121,6 +172,23 @@ class PixelEditorCanvas(QWidget):
         self.redo_stack.clear()
         self.historyChanged.emit()
         
+    @staticmethod
+    def detect_char_height(height):
+        """Return the character height for a bitmap strip of the given height."""
+        if height == 2048:  # 256 chars * 8
+            return 8
+        elif height == 2259:  # 256 chars * 9
+            return 9
+        elif height == 3390:  # 256 chars * 15
+            return 15
+        elif height == 3584:  # 256 chars * 14
+            return 14
+        # Calculate by dividing by 256 (extended ASCII)
+        char_height = height // 256
+        if char_height < 1:
+            char_height = 8  # fallback
+        return char_height
+    
     def update_size(self):
         """Update widget size based on image and zoom."""
         if self.image:
@@ -129,6 +197,19 @@ class PixelEditorCanvas(QWidget):
                 self.image.height() * self.zoom_level
             )
             self.setFixedSize(new_size)
+            if self.grid_enabled:
+                self._grid_tile = self._build_grid_tile()
+    
+    def _build_grid_tile(self):
+        """Render a single zoomed grid cell for drawTiledPixmap."""
+        tile = QPixmap(self.zoom_level, self.zoom_level)
+        tile.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(tile)
+        painter.setPen(QPen(QColor(100, 100, 100, 100), 1))
+        painter.drawLine(0, 0, 0, self.zoom_level - 1)
+        painter.drawLine(0, 0, self.zoom_level - 1, 0)
+        painter.end()
+        return tile
             
     def paintEvent(self, event: QPaintEvent):
         """Draw the zoomed pixel grid."""
@@ -137,99 +218,62 @@ class PixelEditorCanvas(QWidget):
             
         painter = QPainter(self)
         
+        # Only the exposed area needs repainting; work out which image pixels it covers
+        dirty = event.rect()
+        x0 = max(0, (dirty.left() - self.ruler_width) // self.zoom_level)
+        x1 = min(self.image.width(), (dirty.right() - self.ruler_width) // self.zoom_level + 1)
+        y0 = max(0, dirty.top() // self.zoom_level)
+        y1 = min(self.image.height(), dirty.bottom() // self.zoom_level + 1)
+        
         # Draw left ruler background
         painter.fillRect(0, 0, self.ruler_width, self.height(), QColor(40, 40, 40))
         
-        # Draw pixels (offset by ruler width)
-        for y in range(self.image.height()):
-            for x in range(self.image.width()):
-                color_idx = self.image.pixelIndex(x, y)
-                color = QColor.fromRgb(self.image.color(color_idx))
-                
-                rect = QRect(
-                    self.ruler_width + x * self.zoom_level,
-                    y * self.zoom_level,
-                    self.zoom_level,
-                    self.zoom_level
-                )
-                painter.fillRect(rect, color)
+        # Draw the exposed pixels (offset by ruler width); QPainter does the
+        # nearest-neighbour upscale, so the cost is bounded by the dirty area
+        if x0 < x1 and y0 < y1:
+            painter.drawImage(
+                QRect(
+                    self.ruler_width + x0 * self.zoom_level,
+                    y0 * self.zoom_level,
+                    (x1 - x0) * self.zoom_level,
+                    (y1 - y0) * self.zoom_level
+                ),
+                self.image,
+                QRect(x0, y0, x1 - x0, y1 - y0)
+            )
         
         # Draw grid
-        if self.grid_enabled:
-            painter.setPen(QPen(QColor(100, 100, 100, 100), 1))
-            for x in range(self.image.width() + 1):
-                painter.drawLine(
-                    self.ruler_width + x * self.zoom_level, 0,
-                    self.ruler_width + x * self.zoom_level, self.image.height() * self.zoom_level
-                )
-            for y in range(self.image.height() + 1):
-                painter.drawLine(
-                    self.ruler_width, y * self.zoom_level,
-                    self.ruler_width + self.image.width() * self.zoom_level, y * self.zoom_level
-                )
+        if self.grid_enabled and x0 < x1 and y0 < y1:
+            if self._grid_tile is None or self._grid_tile.width() != self.zoom_level:
+                self._grid_tile = self._build_grid_tile()
+            painter.drawTiledPixmap(
+                self.ruler_width + x0 * self.zoom_level,
+                y0 * self.zoom_level,
+                (x1 - x0) * self.zoom_level,
+                (y1 - y0) * self.zoom_level,
+                self._grid_tile
+            )
         
         # Draw character indices on left ruler
         if self.show_char_indices and self.char_height > 0:
             num_chars = self.image.height() // self.char_height
-            for char_idx in range(num_chars):
-                y_start = char_idx * self.char_height * self.zoom_level
-                y_end = (char_idx + 1) * self.char_height * self.zoom_level
-                
-                # Highlight on hover
-                is_hovered = (self.hover_y >= char_idx * self.char_height and 
-                             self.hover_y < (char_idx + 1) * self.char_height)
-                
-                # Draw character boundary line
-                if char_idx > 0:
-                    painter.setPen(QPen(QColor(255, 0, 0, 150) if is_hovered else QColor(0, 255, 0, 80), 2))
-                    painter.drawLine(0, y_start, self.ruler_width + self.image.width() * self.zoom_level, y_start)
-                
-                # Draw character index label on ruler
-                ascii_val = char_idx
-                # Standard ASCII printable characters
-                if 32 <= ascii_val < 127:
-                    char_repr = chr(ascii_val)
-                # Windows-1252 extended characters (128-255)
-                elif 128 <= ascii_val <= 255:
-                    try:
-                        char_repr = bytes([ascii_val]).decode('windows-1252')
-                    except:
-                        char_repr = ''
-                else:
-                    char_repr = ''
-                
-                label_text = f"ASCII: {char_idx}\n{char_repr}" if char_repr else f"ASCII: {char_idx}"
-                
-                # Background for text
-                painter.setPen(Qt.PenStyle.NoPen)
-                if is_hovered:
-                    painter.setBrush(QColor(255, 255, 0, 200))
-                else:
-                    painter.setBrush(QColor(60, 60, 60, 200))
-                text_rect = QRect(2, y_start + 2, self.ruler_width - 4, y_end - y_start - 4)
-                painter.drawRect(text_rect)
-                
-                # Text with monospace font
-                painter.setPen(QColor(255, 255, 255) if not is_hovered else QColor(0, 0, 0))
-                from PyQt6.QtGui import QFont
-                
-                # Draw ASCII label (smaller font)
-                ascii_label = f"ASCII: {char_idx}"
-                small_font = QFont("Courier New", 11)
-                small_font.setStyleHint(QFont.StyleHint.Monospace)
-                painter.setFont(small_font)
-                
-                # Calculate positions for two-line layout
-                label_rect = QRect(2, y_start + 6, self.ruler_width - 4, 12)
-                painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, ascii_label)
-                
-                # Draw character representation (larger font)
-                if char_repr:
-                    large_font = QFont("Courier New", 22)
-                    large_font.setStyleHint(QFont.StyleHint.Monospace)
-                    painter.setFont(large_font)
-                    char_rect = QRect(2, y_start + 14, self.ruler_width - 4, y_end - y_start - 16)
-                    painter.drawText(char_rect, Qt.AlignmentFlag.AlignCenter, char_repr)
+            strip_height = self.char_height * self.zoom_level
+            hovered_char = self.hover_y // self.char_height if self.hover_y >= 0 else -1
+            
+            # Only labels of the strips intersecting the dirty area are drawn
+            first_label = max(0, dirty.top() // strip_height)
+            last_label = min(num_chars, dirty.bottom() // strip_height + 1)
+            for char_idx in range(first_label, last_label):
+                self._draw_char_label(painter, char_idx, char_idx == hovered_char)
+            
+            # Boundary lines are 2px wide, so include the strip just below the dirty area
+            first_char = max(1, dirty.top() // strip_height)
+            last_char = min(num_chars, (dirty.bottom() + 1) // strip_height + 1)
+            for char_idx in range(first_char, last_char):
+                is_hovered = char_idx == hovered_char
+                y_start = char_idx * strip_height
+                painter.setPen(QPen(QColor(255, 0, 0, 150) if is_hovered else QColor(0, 255, 0, 80), 2))
+                painter.drawLine(0, y_start, self.ruler_width + self.image.width() * self.zoom_level, y_start)
         
         # Draw selection rectangle
         if self.selection_start and self.selection_end:
@@ -239,6 +283,7 @@ class PixelEditorCanvas(QWidget):
             y2 = max(self.selection_start[1], self.selection_end[1]) * self.zoom_level + self.zoom_level
             
             painter.setPen(QPen(QColor(255, 255, 0), 2, Qt.PenStyle.DashLine))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRect(x1, y1, x2 - x1, y2 - y1)
         
         # Draw paste preview
@@ -247,24 +292,22 @@ class PixelEditorCanvas(QWidget):
             cw, ch = self.clipboard_size
             
             # Draw semi-transparent preview
+            if self._clipboard_pixmap is None:
+                self._clipboard_pixmap = self._build_clipboard_pixmap()
             painter.setOpacity(0.7)
-            for dy in range(ch):
-                for dx in range(cw):
-                    if dy * cw + dx < len(self.clipboard_data):
-                        color_idx = self.clipboard_data[dy * cw + dx]
-                        color = QColor.fromRgb(self.image.color(color_idx))
-                        
-                        rect = QRect(
-                            self.ruler_width + (px + dx) * self.zoom_level,
-                            (py + dy) * self.zoom_level,
-                            self.zoom_level,
-                            self.zoom_level
-                        )
-                        painter.fillRect(rect, color)
-            
+            painter.drawPixmap(
+                QRect(
+                    self.ruler_width + px * self.zoom_level,
+                    py * self.zoom_level,
+                    cw * self.zoom_level,
+                    ch * self.zoom_level
+                ),
+                self._clipboard_pixmap
+            )
             painter.setOpacity(1.0)
             # Draw border around paste preview
             painter.setPen(QPen(QColor(0, 255, 0), 2, Qt.PenStyle.SolidLine))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRect(
                 self.ruler_width + px * self.zoom_level,
                 py * self.zoom_level,
@@ -272,6 +315,56 @@ class PixelEditorCanvas(QWidget):
                 ch * self.zoom_level
             )
     
+    def _draw_char_label(self, painter, char_idx, is_hovered):
+        """Draw the ASCII code and glyph label for one character on the ruler."""
+        y_start = char_idx * self.char_height * self.zoom_level
+        y_end = (char_idx + 1) * self.char_height * self.zoom_level
+        
+        # Draw character index label on ruler
+        ascii_val = char_idx
+        # Standard ASCII printable characters
+        if 32 <= ascii_val < 127:
+            char_repr = chr(ascii_val)
+        # Windows-1252 extended characters (128-255)
+        elif 128 <= ascii_val <= 255:
+            try:
+                char_repr = bytes([ascii_val]).decode('windows-1252')
+            except:
+                char_repr = ''
+        else:
+            char_repr = ''
+        
+        # Background for text
+        painter.setPen(Qt.PenStyle.NoPen)
+        if is_hovered:
+            painter.setBrush(QColor(255, 255, 0, 200))
+        else:
+            painter.setBrush(QColor(60, 60, 60, 200))
+        text_rect = QRect(2, y_start + 2, self.ruler_width - 4, y_end - y_start - 4)
+        painter.drawRect(text_rect)
+        
+        # Text with monospace font
+        painter.setPen(QColor(255, 255, 255) if not is_hovered else QColor(0, 0, 0))
+        from PyQt6.QtGui import QFont
+        
+        # Draw ASCII label (smaller font)
+        ascii_label = f"ASCII: {char_idx}"
+        small_font = QFont("Courier New", 11)
+        small_font.setStyleHint(QFont.StyleHint.Monospace)
+        painter.setFont(small_font)
+        
+        # Calculate positions for two-line layout
+        label_rect = QRect(2, y_start + 6, self.ruler_width - 4, 12)
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, ascii_label)
+        
+        # Draw character representation (larger font)
+        if char_repr:
+            large_font = QFont("Courier New", 22)
+            large_font.setStyleHint(QFont.StyleHint.Monospace)
+            painter.setFont(large_font)
+            char_rect = QRect(2, y_start + 14, self.ruler_width - 4, y_end - y_start - 16)
+            painter.drawText(char_rect, Qt.AlignmentFlag.AlignCenter, char_repr)
+    
     def mousePressEvent(self, event: QMouseEvent):
         """Start drawing, selecting, or paste dragging."""
         if not self.image:
@@ -299,9 +392,10 @@ class PixelEditorCanvas(QWidget):
                 self.selectionChanged.emit(True)
                 self.update()
             elif self.edit_mode == 'draw':
-                # Normal drawing - save state for undo
-                self.save_state("Draw")
+                # Normal drawing - remember the starting state for undo
+                self._pre_bits = self._snapshot()
                 self.drawing = True
+                self._last_draw_pos = (x, y)
                 self.draw_pixel(event.pos())
     
     def mouseMoveEvent(self, event: QMouseEvent):
@@ -310,8 +404,10 @@ class PixelEditorCanvas(QWidget):
             # Update hover position
             old_hover = self.hover_y
             self.hover_y = event.pos().y() // self.zoom_level
-            if old_hover != self.hover_y:
-                self.update()
+            if old_hover != self.hover_y and not self._hover_update_pending:
+                # Coalesce hover repaints to one per event-loop iteration
+                self._hover_update_pending = True
+                QTimer.singleShot(0, self._flush_hover_update)
             
             # Adjust for ruler offset
             x = (event.pos().x() - self.ruler_width) // self.zoom_level
@@ -325,20 +421,23 @@ class PixelEditorCanvas(QWidget):
             elif self.paste_dragging:
                 self.paste_position = (x, y)
                 self.update()
-            # Draw if mouse is pressed
+            # Draw if mouse is pressed, joining up with the previous sample
             elif self.drawing:
-                self.draw_pixel(event.pos())
+                self._draw_line(self._last_draw_pos, (x, y))
+                self._last_draw_pos = (x, y)
     
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Stop drawing, selecting, or paste dragging."""
         if event.button() == Qt.MouseButton.LeftButton:
             was_drawing = self.drawing
             self.drawing = False
+            self._last_draw_pos = None
             self.selecting = False
             self.paste_dragging = False
-            # Emit signal to update UI if we were drawing
+            # Record what the stroke changed (nothing is recorded for a no-op stroke)
             if was_drawing:
-                self.update()
+                self._record_delta(self._pre_bits, "Draw")
+                self._pre_bits = None
     
     def draw_pixel(self, pos):
         """Draw a pixel at the given position."""
@@ -350,15 +449,99 @@ class PixelEditorCanvas(QWidget):
         y = pos.y() // self.zoom_level
         
         if 0 <= x < self.image.width() and 0 <= y < self.image.height():
-            self.image.setPixel(x, y, self.current_color_index)
-            self.update()
+            mv = self._pixel_buffer(writable=True)
+            # Nothing to do if the pixel already has the current color
+            if mv[y * self._stride + x] == self.current_color_index:
+                return
+            mv[y * self._stride + x] = self.current_color_index
+            self.update(QRect(
+                self.ruler_width + x * self.zoom_level,
+                y * self.zoom_level,
+                self.zoom_level,
+                self.zoom_level
+            ))
             self.pixelChanged.emit(x, y, self.current_color_index)
     
+    def _draw_line(self, start, end):
+        """Paint every pixel on the line between two image coords (Bresenham)."""
+        x, y = start
+        x_end, y_end = end
+        dx = abs(x_end - x)
+        dy = -abs(y_end - y)
+        step_x = 1 if x < x_end else -1
+        step_y = 1 if y < y_end else -1
+        error = dx + dy
+        
+        width = self.image.width()
+        height = self.image.height()
+        mv = self._pixel_buffer(writable=True)
+        stride = self._stride
+        painted = []
+        while True:
+            if 0 <= x < width and 0 <= y < height and mv[y * stride + x] != self.current_color_index:
+                mv[y * stride + x] = self.current_color_index
+                painted.append((x, y))
+            if x == x_end and y == y_end:
+                break
+            e2 = 2 * error
+            if e2 >= dy:
+                error += dy
+                x += step_x
+            if e2 <= dx:
+                error += dx
+                y += step_y
+        
+        if not painted:
+            return
+        
+        # Schedule a single repaint covering the whole segment
+        self.update(self._cells_rect(painted))
+        for px, py in painted:
+            self.pixelChanged.emit(px, py, self.current_color_index)
+    
+    def _cells_rect(self, cells):
+        """Widget rect bounding a list of (x, y) image cells."""
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        return QRect(
+            self.ruler_width + min(xs) * self.zoom_level,
+            min(ys) * self.zoom_level,
+            (max(xs) - min(xs) + 1) * self.zoom_level,
+            (max(ys) - min(ys) + 1) * self.zoom_level
+        )
+    
+    def _smart_update(self, rect=None):
+        """Schedule a repaint unless the canvas is hidden or scrolled fully out of view."""
+        if self.visibleRegion().isEmpty():
+            return
+        if rect is None:
+            self.update()
+        else:
+            self.update(rect)
+    
+    def _flush_hover_update(self):
+        """Repaint the strips of the previously and newly hovered characters."""
+        self._hover_update_pending = False
+        if self.char_height <= 0:
+            return
+        new_char = self.hover_y // self.char_height if self.hover_y >= 0 else -1
+        if new_char != self._hover_painted_char:
+            if self._hover_painted_char >= 0:
+                self.update(self._char_strip_rect(self._hover_painted_char))
+            if new_char >= 0:
+                self.update(self._char_strip_rect(new_char))
+            self._hover_painted_char = new_char
+    
+    def _char_strip_rect(self, char_idx):
+        """Widget area covered by one character's row, including its boundary lines."""
+        strip_height = self.char_height * self.zoom_level
+        return QRect(0, char_idx * strip_height - 1, self.width(), strip_height + 2)
+    
     def set_zoom(self, zoom_level):
         """Set zoom level."""
         self.zoom_level = zoom_level
         self.update_size()
-        self.update()
+        self._smart_update()
     
     def set_color(self, color_index):
         """Set current drawing color by palette index."""
@@ -367,7 +550,7 @@ class PixelEditorCanvas(QWidget):
     def set_char_height(self, height):
         """Set the height of each character in pixels."""
         self.char_height = height
-        self.update()
+        self._smart_update()
     
     def jump_to_character(self, char_index):
         """Emit signal to scroll to a specific character."""
@@ -387,19 +570,33 @@ class PixelEditorCanvas(QWidget):
         width = x2 - x1 + 1
         height = y2 - y1 + 1
         
-        # Copy pixel data
-        self.clipboard_data = []
+        # Copy pixel data row by row; cells outside the image become index 0
+        mv = self._pixel_buffer()
+        stride = self.image.bytesPerLine()
+        cx1 = max(x1, 0)
+        cx2 = min(x2, self.image.width() - 1)
+        rows = []
         for y in range(y1, y2 + 1):
-            for x in range(x1, x2 + 1):
-                if 0 <= x < self.image.width() and 0 <= y < self.image.height():
-                    self.clipboard_data.append(self.image.pixelIndex(x, y))
-                else:
-                    self.clipboard_data.append(0)
+            if 0 <= y < self.image.height() and cx1 <= cx2:
+                rows.append(bytes(cx1 - x1))
+                rows.append(mv[y * stride + cx1:y * stride + cx2 + 1])
+                rows.append(bytes(x2 - cx2))
+            else:
+                rows.append(bytes(width))
+        self.clipboard_data = b"".join(rows)
         
         self.clipboard_size = (width, height)
+        self._clipboard_pixmap = self._build_clipboard_pixmap()
         self.selectionChanged.emit(False)  # Selection will be cleared after copy
         return True
     
+    def _build_clipboard_pixmap(self):
+        """Render the clipboard with the current palette for the paste preview."""
+        cw, ch = self.clipboard_size
+        image = QImage(self.clipboard_data, cw, ch, cw, QImage.Format.Format_Indexed8)
+        image.setColorTable(self.image.colorTable())
+        return QPixmap.fromImage(image)
+    
     def start_paste_mode(self):
         """Enter paste mode with moveable preview."""
         if not self.clipboard_data or not self.clipboard_size:
@@ -416,40 +613,44 @@ class PixelEditorCanvas(QWidget):
         if not self.paste_mode or not self.clipboard_data or not self.paste_position:
             return False
         
-        # Save state for undo
-        self.save_state("Paste")
-        
         px, py = self.paste_position
         cw, ch = self.clipboard_size
         
-        # Paste pixels
-        for dy in range(ch):
-            for dx in range(cw):
-                target_x = px + dx
-                target_y = py + dy
-                if (0 <= target_x < self.image.width() and 
-                    0 <= target_y < self.image.height() and
-                    dy * cw + dx < len(self.clipboard_data)):
-                    color_idx = self.clipboard_data[dy * cw + dx]
-                    self.image.setPixel(target_x, target_y, color_idx)
-        
+        # Paste one clipped row slice at a time. The undo run is the band of rows
+        # under the paste, read before and after, so no full snapshot is needed.
+        mv = self._pixel_buffer(writable=True)
+        stride = self._stride
+        sx1 = max(0, -px)
+        sx2 = min(cw, self.image.width() - px)
+        row_start = max(0, -py)
+        row_end = min(ch, self.image.height() - py)
+        if sx1 < sx2 and row_start < row_end:
+            band_start = (py + row_start) * stride
+            band_end = (py + row_end) * stride
+            old_bytes = bytes(mv[band_start:band_end])
+            for dy in range(row_start, row_end):
+                start = (py + dy) * stride + px + sx1
+                mv[start:start + sx2 - sx1] = self.clipboard_data[dy * cw + sx1:dy * cw + sx2]
+            new_bytes = bytes(mv[band_start:band_end])
+            if new_bytes != old_bytes:
+                self._push_delta(((band_start, old_bytes, new_bytes),), "Paste")
         self.paste_mode = False
         self.paste_position = None
-        self.update()
+        self._smart_update()
         return True
     
     def cancel_paste(self):
         """Cancel paste mode."""
         self.paste_mode = False
         self.paste_position = None
-        self.update()
+        self._smart_update()
     
     def clear_selection(self):
         """Clear current selection."""
         self.selection_start = None
         self.selection_end = None
         self.selectionChanged.emit(False)
-        self.update()
+        self._smart_update()
     
     def set_edit_mode(self, mode):
         """Set edit mode to 'draw' or 'select'."""
@@ -463,59 +664,92 @@ class PixelEditorCanvas(QWidget):
         """Get current edit mode."""
         return self.edit_mode
     
-    def save_state(self, description="Action"):
-        """Save current image state to undo stack."""
-        if not self.image:
+    def _pixel_buffer(self, writable=False):
+        """Return a memoryview over the raw image buffer (rows are bytesPerLine() apart)."""
+        if writable:
+            # The image is never shared, so its buffer stays put until load_image replaces it
+            if self._bits_mv is None:
+                ptr = self.image.bits()
+                ptr.setsize(self.image.sizeInBytes())
+                self._bits_mv = memoryview(ptr)
+                self._stride = self.image.bytesPerLine()
+            return self._bits_mv
+        ptr = self.image.constBits()
+        ptr.setsize(self.image.sizeInBytes())
+        return memoryview(ptr)
+    
+    def _snapshot(self):
+        """Return a copy of the raw image buffer (scanline padding included)."""
+        return bytes(self._pixel_buffer())
+    
+    def _record_delta(self, before, description="Action"):
+        """Push the bytes that changed since `before` (a _snapshot()) as one undo step."""
+        if not self.image or before is None:
             return
         
-        # Capture current pixel data
-        width = self.image.width()
-        height = self.image.height()
-        pixel_data = []
-        for y in range(height):
-            for x in range(width):
-                pixel_data.append(self.image.pixelIndex(x, y))
-        
-        # Add to undo stack
-        self.undo_stack.append((pixel_data, description, width, height))
+        after = self._pixel_buffer()
+        stride = self.image.bytesPerLine()
+        
+        # Narrow down in C-level slice compares: skip unchanged blocks of rows,
+        # then collect changed rows, merging neighbours into one run
+        spans = []  # [start, end) byte ranges of changed rows
+        span_end = self.image.height() * stride
+        block = stride * 64
+        for block_start in range(0, span_end, block):
+            block_end = min(block_start + block, span_end)
+            if after[block_start:block_end] == before[block_start:block_end]:
+                continue
+            for start in range(block_start, block_end, stride):
+                if after[start:start + stride] != before[start:start + stride]:
+                    if spans and spans[-1][1] == start:
+                        spans[-1][1] = start + stride
+                    else:
+                        spans.append([start, start + stride])
+        if not spans:
+            return
         
-        # Limit stack size
-        if len(self.undo_stack) > self.max_history:
-            self.undo_stack.pop(0)
+        self._push_delta(
+            tuple((start, bytes(before[start:end]), bytes(after[start:end])) for start, end in spans),
+            description
+        )
+    
+    def _push_delta(self, runs, description="Action"):
+        """Push an already computed delta (tuple of row runs) as one undo step."""
+        self.undo_stack.append((runs, description, self.image.width(), self.image.height()))
         
         # Clear redo stack when new action is performed
         self.redo_stack.clear()
         
         # Notify that history changed
         self.historyChanged.emit()
-        
-        # Notify that history changed
-        self.historyChanged.emit()
+    
+    def _apply_delta(self, runs, restore_old):
+        """Write the old or new bytes of each run back into the image and repaint them."""
+        mv = self._pixel_buffer(writable=True)
+        for start, old_bytes, new_bytes in runs:
+            values = old_bytes if restore_old else new_bytes
+            mv[start:start + len(values)] = values
+        
+        # One repaint over the rows spanned by the runs
+        first_row = min(start for start, _, _ in runs) // self._stride
+        last_row = max(start + len(old_bytes) - 1 for start, old_bytes, _ in runs) // self._stride
+        self._smart_update(QRect(
+            self.ruler_width,
+            first_row * self.zoom_level,
+            self.image.width() * self.zoom_level,
+            (last_row - first_row + 1) * self.zoom_level
+        ))
     
     def undo(self):
         """Undo last action."""
         if not self.image or not self.undo_stack:
             return False
         
-        # Save current state to redo stack
-        width = self.image.width()
-        height = self.image.height()
-        pixel_data = []
-        for y in range(height):
-            for x in range(width):
-                pixel_data.append(self.image.pixelIndex(x, y))
-        self.redo_stack.append((pixel_data, "Current", width, height))
-        
-        # Restore previous state
-        pixel_data, description, w, h = self.undo_stack.pop()
-        if w == width and h == height:
-            idx = 0
-            for y in range(height):
-                for x in range(width):
-                    if idx < len(pixel_data):
-                        self.image.setPixel(x, y, pixel_data[idx])
-                    idx += 1
-            self.update()
+        # Restore previous state and keep the step for redo
+        delta, description, w, h = self.undo_stack.pop()
+        if w == self.image.width() and h == self.image.height():
+            self._apply_delta(delta, restore_old=True)
+            self.redo_stack.append((delta, description, w, h))
             self.historyChanged.emit()
             return True
         return False
@@ -525,25 +759,11 @@ class PixelEditorCanvas(QWidget):
         if not self.image or not self.redo_stack:
             return False
         
-        # Save current state to undo stack
-        width = self.image.width()
-        height = self.image.height()
-        pixel_data = []
-        for y in range(height):
-            for x in range(width):
-                pixel_data.append(self.image.pixelIndex(x, y))
-        self.undo_stack.append((pixel_data, "Current", width, height))
-        
-        # Restore next state
-        pixel_data, description, w, h = self.redo_stack.pop()
-        if w == width and h == height:
-            idx = 0
-            for y in range(height):
-                for x in range(width):
-                    if idx < len(pixel_data):
-                        self.image.setPixel(x, y, pixel_data[idx])
-                    idx += 1
-            self.update()
+        # Reapply the step and make it undoable again
+        delta, description, w, h = self.redo_stack.pop()
+        if w == self.image.width() and h == self.image.height():
+            self._apply_delta(delta, restore_old=False)
+            self.undo_stack.append((delta, description, w, h))
             self.historyChanged.emit()
             return True
         return False
@@ -565,21 +785,40 @@ class PixelEditorCanvas(QWidget):
         width = self.image.width()
         height = self.image.height()
         
-        # Create PIL image with palette
-        pil_image = Image.new('P', (width, height))
+        # Hand the raw buffer to PIL; the stride skips Qt's scanline padding
+        pil_image = Image.frombuffer(
+            'P', (width, height), self._snapshot(),
+            'raw', 'P', self.image.bytesPerLine(), 1
+        )
         pil_image.putpalette(self.original_palette)
-        
-        # Copy pixel data
-        pixels = []
-        for y in range(height):
-            for x in range(width):
-                pixels.append(self.image.pixelIndex(x, y))
-        
-        pil_image.putdata(pixels)
         pil_image.save(output_path, 'BMP')
         return True
 
 
+# Only used by CharacterThumbnail, which the main window does not currently create
+def _load_thumbnail(filepath):
+    """Decode and scale a thumbnail, reusing QPixmapCache until the file changes."""
+    key = f"thumb:{filepath}:{os.stat(filepath).st_mtime_ns}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+    
+    image = QImage(filepath)
+    if image.isNull():
+        return None
+    # Scale to reasonable size
+    scaled = image.scaled(
+        50, 50,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.FastTransformation
+    )
+    pixmap = QPixmap.fromImage(scaled)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# Note: the main window does not currently show any thumbnails; this widget
+# (and its lazy preview loading) is kept for a future thumbnail view.
 class CharacterThumbnail(QFrame):
     """Thumbnail widget displaying a character with its index number."""
     
@@ -589,6 +828,7 @@ class CharacterThumbnail(QFrame):
         super().__init__(parent)
         self.filepath = filepath
         self.index = index
+        self._loaded = False  # Preview is decoded on first show
         
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         self.setLineWidth(2)
@@ -600,29 +840,29 @@ class CharacterThumbnail(QFrame):
         # Index label
         index_label = QLabel(f"#{index}")
         index_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        index_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+        index_label.setObjectName("sectionLabel")
         
         # Image preview
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.load_preview()
         
         layout.addWidget(index_label)
         layout.addWidget(self.image_label)
         self.setLayout(layout)
         
+    def showEvent(self, event):
+        """Load the preview the first time the thumbnail becomes visible."""
+        if not self._loaded:
+            self._loaded = True
+            self.load_preview()
+        super().showEvent(event)
+    
     def load_preview(self):
         """Load and display thumbnail preview."""
         try:
-            image = QImage(self.filepath)
-            if not image.isNull():
-                # Scale to reasonable size
-                scaled = image.scaled(
-                    50, 50,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.FastTransformation
-                )
-                self.image_label.setPixmap(QPixmap.fromImage(scaled))
+            pixmap = _load_thumbnail(self.filepath)
+            if pixmap is not None:
+                self.image_label.setPixmap(pixmap)
         except Exception as e:
             self.image_label.setText("Error")
     
@@ -640,11 +880,22 @@ class MonkeyIslandFontEditor(QMainWindow):
         super().__init__()
         self.current_file = None
         self.current_index = None
+        self._load_serial = 0  # Bumped per load_character; stale queued decodes are dropped
+        self._base_info_text = ""  # Info label text for the loaded bitmap
+        self._pending_scroll = None  # Scroll target applied on the next event loop pass
+        # Last enabled state pushed to the history/selection buttons
+        self._undo_state = None
+        self._redo_state = None
+        self._clear_sel_state = None
+        # Transient info-label messages (see _flash)
+        self._flash_serial = 0
+        self._flash_active = False
+        self._flash_saved_text = ""
         self.workspace_dir = None
         self.color_buttons = []
         self.color_button_group = None
         self.bitmap_selector_frame = None
-        self.bitmap_buttons_container = None
+        self.bitmap_buttons = []
         
         self.setWindowTitle("Monkey Island Bitmap Font Editor")
         self.setGeometry(100, 100, 1200, 800)
@@ -758,6 +1009,12 @@ class MonkeyIslandFontEditor(QMainWindow):
         """)
         controls_layout.addWidget(self.select_mode_btn)
         
+        # Exclusive group: checking one mode button unchecks the other
+        self._mode_group = QButtonGroup(self)
+        self._mode_group.setExclusive(True)
+        self._mode_group.addButton(self.draw_mode_btn)
+        self._mode_group.addButton(self.select_mode_btn)
+        
         self.clear_sel_btn = QPushButton("✖ Clear")
         self.clear_sel_btn.setToolTip("Clear current selection")
         self.clear_sel_btn.clicked.connect(self.clear_selection_action)
@@ -830,22 +1087,16 @@ class MonkeyIslandFontEditor(QMainWindow):
         # Bitmap file selector buttons
         self.bitmap_selector_frame = QFrame()
         self.bitmap_selector_frame.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
-        bitmap_selector_layout = QVBoxLayout()
-        bitmap_selector_layout.setContentsMargins(5, 5, 5, 5)
-        bitmap_selector_layout.setSpacing(3)
+        # Bitmap buttons are added below the label (populated later)
+        self.bitmap_selector_layout = QVBoxLayout()
+        self.bitmap_selector_layout.setContentsMargins(5, 5, 5, 5)
+        self.bitmap_selector_layout.setSpacing(3)
         
         bitmap_label = QLabel("Select Bitmap File")
-        bitmap_label.setStyleSheet("font-weight: bold; font-size: 11px;")
-        bitmap_selector_layout.addWidget(bitmap_label)
-        
-        # Container for bitmap buttons (will be populated later)
-        self.bitmap_buttons_container = QWidget()
-        self.bitmap_buttons_layout = QVBoxLayout()
-        self.bitmap_buttons_layout.setSpacing(3)
-        self.bitmap_buttons_container.setLayout(self.bitmap_buttons_layout)
-        bitmap_selector_layout.addWidget(self.bitmap_buttons_container)
+        bitmap_label.setObjectName("bitmapLabel")
+        self.bitmap_selector_layout.addWidget(bitmap_label)
 
-        self.bitmap_selector_frame.setLayout(bitmap_selector_layout)
+        self.bitmap_selector_frame.setLayout(self.bitmap_selector_layout)
         right_layout.addWidget(self.bitmap_selector_frame)
         
         # Color picker
@@ -855,17 +1106,32 @@ class MonkeyIslandFontEditor(QMainWindow):
         color_picker_layout.setContentsMargins(5, 5, 5, 5)
         
         color_label = QLabel("Color Palette")
-        color_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+        color_label.setObjectName("sectionLabel")
         color_picker_layout.addWidget(color_label)
         
         # Color grid container
-        color_container = QWidget()
-        color_container.setFixedSize(256, 256)
+        self.color_container = QWidget()
+        self.color_container.setFixedSize(256, 256)
         self.color_layout = QGridLayout()
         self.color_layout.setSpacing(0)
         self.color_layout.setContentsMargins(0, 0, 0, 0)
-        color_container.setLayout(self.color_layout)
-        color_picker_layout.addWidget(color_container)
+        self.color_container.setLayout(self.color_layout)
+        color_picker_layout.addWidget(self.color_container)
+        
+        # Fixed pool of palette buttons (16 per row), reused for every bitmap
+        self.color_button_group = QButtonGroup(self)
+        self.color_button_group.setExclusive(True)
+        self.color_button_group.idClicked.connect(self.set_color)
+        colors_per_row = 16
+        for i in range(256):
+            btn = QPushButton()
+            btn.setFixedSize(16, 16)
+            btn.setCheckable(True)
+            btn.setObjectName(f"color{i}")
+            btn.setVisible(False)
+            self.color_button_group.addButton(btn, i)
+            self.color_layout.addWidget(btn, i // colors_per_row, i % colors_per_row)
+            self.color_buttons.append(btn)
         
         color_picker_frame.setLayout(color_picker_layout)
         right_layout.addWidget(color_picker_frame)
@@ -877,7 +1143,7 @@ class MonkeyIslandFontEditor(QMainWindow):
         ascii_layout.setContentsMargins(5, 5, 5, 5)
         
         ascii_label = QLabel("Jump to Character")
-        ascii_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+        ascii_label.setObjectName("sectionLabel")
         ascii_layout.addWidget(ascii_label)
         
         # Scrollable ASCII table
@@ -885,12 +1151,28 @@ class MonkeyIslandFontEditor(QMainWindow):
         ascii_scroll.setWidgetResizable(True)
         ascii_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
-        ascii_container = QWidget()
+        self.ascii_container = QWidget()
+        self.ascii_container.setStyleSheet("""
+            QPushButton {
+                font-size: 10px;
+                font-family: Menlo, Monaco, 'Courier New', monospace;
+            }
+        """)
         self.ascii_layout = QGridLayout()
         self.ascii_layout.setSpacing(2)
         self.ascii_layout.setContentsMargins(2, 2, 2, 2)
-        ascii_container.setLayout(self.ascii_layout)
-        ascii_scroll.setWidget(ascii_container)
+        self.ascii_container.setLayout(self.ascii_layout)
+        
+        # Single dispatch for all jump buttons (button id == character index)
+        self._ascii_group = QButtonGroup(self)
+        self._ascii_group.idClicked.connect(self.jump_to_character)
+        
+        # Pool of jump buttons, shown up to the bitmap's char count
+        self._ascii_btns = []
+        self._ascii_visible = 0  # Number of leading pool buttons currently shown
+        self._ensure_ascii_buttons(256)
+        
+        ascii_scroll.setWidget(self.ascii_container)
         ascii_layout.addWidget(ascii_scroll)
         
         ascii_frame.setLayout(ascii_layout)
@@ -904,47 +1186,37 @@ class MonkeyIslandFontEditor(QMainWindow):
         """Load all character bitmaps from workspace directory."""
         # Get workspace directory (default to script location)
         if self.workspace_dir is None:
-            self.workspace_dir = Path(__file__).parent
+            self.workspace_dir = WORKSPACE_DIR
         
         # Update bitmap selector UI based on available files
         self.update_bitmap_selector()
         
         # Auto-load first bitmap if available
-        first_bitmap = self.workspace_dir / "char0001.bmp"
-        if first_bitmap.exists():
+        if os.path.isfile(os.path.join(self.workspace_dir, "char0001.bmp")):
             self.load_bitmap_file("char0001.bmp", 1)
     
     def update_bitmap_selector(self):
         """Update the bitmap selector based on available bitmap files."""
         # Clear existing buttons
-        for i in reversed(range(self.bitmap_buttons_layout.count())):
-            widget = self.bitmap_buttons_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-                widget.deleteLater()
+        for btn in self.bitmap_buttons:
+            self.bitmap_selector_layout.removeWidget(btn)
+            btn.deleteLater()
+        self.bitmap_buttons.clear()
         
         # Check for bitmap files
-        bitmap_files = [
-            ("char0001.bmp", "Sentence Line and Dialog", 1),
-            ("char0002.bmp", "On Screen Text", 2),
-            ("char0003.bmp", "Upside Down Text", 3),
-            ("char0004.bmp", "Title Screen/Credits Text", 4),
-            ("char0006.bmp", "VERB UI", 6),
-        ]
-        
         found_bitmaps = []
-        for filename, label, index in bitmap_files:
-            filepath = self.workspace_dir / filename
-            if filepath.exists():
+        for filename, label, index in BITMAP_FILES:
+            if os.path.isfile(os.path.join(self.workspace_dir, filename)):
                 found_bitmaps.append((filename, label, index))
         
         if found_bitmaps:
             # Create buttons for found bitmaps
             for filename, label, index in found_bitmaps:
                 btn = QPushButton(label)
-                btn.clicked.connect(lambda checked, f=filename, i=index: self.load_bitmap_file(f, i))
-                btn.setStyleSheet("font-size: 8px; padding: 3px; font-weight: bold;")
-                self.bitmap_buttons_layout.addWidget(btn)
+                btn.clicked.connect(functools.partial(self.load_bitmap_file, filename, index))
+                btn.setObjectName("bitmapBtn")
+                self.bitmap_selector_layout.addWidget(btn)
+                self.bitmap_buttons.append(btn)
         else:
             # No bitmaps found - show folder selection button
             select_folder_btn = QPushButton("📁 Select Bitmap Folder")
@@ -962,44 +1234,36 @@ class MonkeyIslandFontEditor(QMainWindow):
                 }
             """)
             select_folder_btn.clicked.connect(self.select_bitmap_folder)
-            self.bitmap_buttons_layout.addWidget(select_folder_btn)
+            self.bitmap_selector_layout.addWidget(select_folder_btn)
+            self.bitmap_buttons.append(select_folder_btn)
     
     def select_bitmap_folder(self):
         """Open dialog to select bitmap folder."""
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Bitmap Folder",
-            str(self.workspace_dir) if self.workspace_dir else str(Path.home()),
+            self.workspace_dir or str(Path.home()),
             QFileDialog.Option.ShowDirsOnly
         )
         
         if folder:
-            self.workspace_dir = Path(folder)
+            self.workspace_dir = folder
             self.update_bitmap_selector()
             
             # Try to auto-load first available bitmap
-            first_bitmap = self.workspace_dir / "char0001.bmp"
-            if first_bitmap.exists():
+            if os.path.isfile(os.path.join(self.workspace_dir, "char0001.bmp")):
                 self.load_bitmap_file("char0001.bmp", 1)
             else:
                 # Check if any bitmaps were found
-                bitmap_files = [
-                    ("char0001.bmp", 1),
-                    ("char0002.bmp", 2),
-                    ("char0003.bmp", 3),
-                    ("char0004.bmp", 4),
-                    ("char0006.bmp", 6),
-                ]
-                for filename, index in bitmap_files:
-                    filepath = self.workspace_dir / filename
-                    if filepath.exists():
+                for filename, label, index in BITMAP_FILES:
+                    if os.path.isfile(os.path.join(self.workspace_dir, filename)):
                         self.load_bitmap_file(filename, index)
                         break
     
     def load_bitmap_file(self, filename, index):
         """Load a specific bitmap file by name."""
-        filepath = self.workspace_dir / filename
-        if not filepath.exists():
+        filepath = os.path.join(self.workspace_dir, filename)
+        if not os.path.isfile(filepath):
             QMessageBox.warning(
                 self,
                 "File Not Found",
@@ -1007,29 +1271,45 @@ class MonkeyIslandFontEditor(QMainWindow):
             )
             return
         
-        self.load_character(str(filepath), index)
+        self.load_character(filepath, index)
     
     def load_character(self, filepath, index):
         """Load a character for editing."""
-        self.current_file = filepath
-        self.current_index = index
+        self._load_serial += 1
+        
+        # Size the jump table from the header alone; pixels are decoded on the next event loop pass
+        size = QImageReader(filepath).size()
+        if size.isValid():
+            height = size.height()
+            self.populate_ascii_table(height // PixelEditorCanvas.detect_char_height(height))
+        QTimer.singleShot(0, functools.partial(self._decode_character, filepath, index, self._load_serial))
+    
+    def _decode_character(self, filepath, index, serial):
+        """Decode the bitmap queued by load_character and refresh the panels."""
+        if serial != self._load_serial:
+            return  # Superseded by a newer load
         
         try:
             self.canvas.load_image(filepath)
+            # Saves keep targeting the previous file until its pixels are replaced
+            self.current_file = filepath
+            self.current_index = index
             # Calculate number of characters in this bitmap strip
             if self.canvas.image:
                 num_chars = self.canvas.image.height() // self.canvas.char_height
-                self.info_label.setText(
-                    f"Editing: {Path(filepath).name} | "
+                self._base_info_text = (
+                    f"Editing: {os.path.basename(filepath)} | "
                     f"Char Height: {self.canvas.char_height}px | "
                     f"Contains {num_chars} characters (ASCII 0-{num_chars-1}) | "
                     f"Hover over canvas to see character indices"
                 )
             else:
-                self.info_label.setText(f"Editing: Character #{index} - {Path(filepath).name}")
-            self.update_color_buttons()
-            self.populate_ascii_table()
+                self._base_info_text = f"Editing: Character #{index} - {os.path.basename(filepath)}"
+            self._set_info_text(self._base_info_text)
             self.update_undo_redo_buttons()
+            # Let the canvas show first; the side panels catch up on the next pass
+            QTimer.singleShot(0, self.update_color_buttons)
+            QTimer.singleShot(0, self.populate_ascii_table)
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -1042,55 +1322,32 @@ class MonkeyIslandFontEditor(QMainWindow):
         if not self.canvas.image:
             return
         
-        # Clear existing buttons
-        for btn in self.color_buttons:
-            self.color_layout.removeWidget(btn)
-            btn.deleteLater()
-        self.color_buttons.clear()
-        
-        # Create button group for exclusive selection
-        self.color_button_group = QButtonGroup(self)
-        self.color_button_group.setExclusive(True)
+        # Read the whole palette in one call instead of color(i) per button
+        color_table = self.canvas.image.colorTable()
+        num_colors = len(color_table)
         
-        # Create button for each palette color (16 per row)
-        num_colors = self.canvas.image.colorCount()
-        colors_per_row = 16
+        # One stylesheet for the whole grid: shared rules plus a background per button
+        style_rules = [COLOR_BUTTON_STYLE]
         
-        for i in range(num_colors):
-            color = QColor.fromRgb(self.canvas.image.color(i))
-            
-            btn = QPushButton()
-            btn.setFixedSize(16, 16)
-            btn.setCheckable(True)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: rgb({color.red()}, {color.green()}, {color.blue()});
-                    border: none;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-                QPushButton:checked {{
-                    border: 2px solid #ffffff;
-                }}
-                QPushButton:hover {{
-                    border: 1px solid #ffff00;
-                }}
-            """)
-            btn.setToolTip(f"Index {i}: RGB({color.red()}, {color.green()}, {color.blue()})")
-            btn.clicked.connect(lambda checked, idx=i: self.set_color(idx))
-            
-            row = i // colors_per_row
-            col = i % colors_per_row
+        for i, btn in enumerate(self.color_buttons):
+            if i >= num_colors:
+                btn.setVisible(False)
+                continue
             
-            self.color_button_group.addButton(btn, i)
-            self.color_layout.addWidget(btn, row, col)
-            self.color_buttons.append(btn)
+            rgb = color_table[i]
+            components = f"{(rgb >> 16) & 0xFF}, {(rgb >> 8) & 0xFF}, {rgb & 0xFF}"
+            style_rules.append(f"QPushButton#color{i} {{ background-color: rgb({components}); }}")
+            btn.setToolTip(f"Index {i}: RGB({components})")
+            btn.setVisible(True)
+        
+        self.color_container.setStyleSheet("\n".join(style_rules))
         
         # Select first color by default
-        if self.color_buttons:
+        if num_colors > 1:
             self.color_buttons[1].setChecked(True)
             self.canvas.set_color(1)
     
+    @pyqtSlot(int)
     def set_color(self, color_index):
         """Set the current drawing color."""
         self.canvas.set_color(color_index)
@@ -1100,47 +1357,59 @@ class MonkeyIslandFontEditor(QMainWindow):
         new_zoom = max(5, min(50, self.canvas.zoom_level + delta))
         self.canvas.set_zoom(new_zoom)
     
-    def populate_ascii_table(self):
+    def _ensure_ascii_buttons(self, count):
+        """Grow the jump-button pool (8 per row) to at least `count` hidden buttons."""
+        chars_per_row = 8
+        for i in range(len(self._ascii_btns), count):
+            if i < len(_ASCII_LABELS):
+                btn = QPushButton(_ASCII_LABELS[i])
+                btn.setToolTip(_ASCII_TOOLTIPS[i])
+            else:
+                # Non-standard strips can hold more than 256 characters
+                btn = QPushButton(str(i))
+                btn.setToolTip(f"Jump to ASCII {i}: '?'")
+            btn.setFixedSize(28, 28)
+            btn.setVisible(False)
+            self._ascii_group.addButton(btn, i)
+            self.ascii_layout.addWidget(btn, i // chars_per_row, i % chars_per_row)
+            self._ascii_btns.append(btn)
+    
+    def populate_ascii_table(self, num_chars=None):
         """Populate the ASCII character jump table."""
-        # Clear existing buttons
-        for i in reversed(range(self.ascii_layout.count())):
-            self.ascii_layout.itemAt(i).widget().setParent(None)
+        if num_chars is None:
+            num_chars = 0
+            if self.canvas.image:
+                num_chars = self.canvas.image.height() // self.canvas.char_height
         
-        if not self.canvas.image:
+        if num_chars == self._ascii_visible:
             return
+        self._ensure_ascii_buttons(num_chars)
         
-        num_chars = self.canvas.image.height() // self.canvas.char_height
-        chars_per_row = 8
-        
-        for i in range(num_chars):
-            # Determine character representation
-            if 32 <= i < 127:
-                char_repr = chr(i)
-            else:
-                char_repr = f"{i}"
-            
-            btn = QPushButton(char_repr)
-            btn.setFixedSize(28, 28)
-            btn.setToolTip(f"Jump to ASCII {i}: '{chr(i) if 0 <= i < 256 else '?'}'")
-            btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 10px;
-                    font-family: Menlo, Monaco, 'Courier New', monospace;
-                }
-            """)
-            btn.clicked.connect(lambda checked, idx=i: self.jump_to_character(idx))
-            
-            row = i // chars_per_row
-            col = i % chars_per_row
-            self.ascii_layout.addWidget(btn, row, col)
+        # Only the buttons between the old and new counts change; repaint once at the end
+        self.ascii_container.setUpdatesEnabled(False)
+        try:
+            for i in range(min(num_chars, self._ascii_visible), max(num_chars, self._ascii_visible)):
+                self._ascii_btns[i].setVisible(i < num_chars)
+        finally:
+            self.ascii_container.setUpdatesEnabled(True)
+        self._ascii_visible = num_chars
     
+    @pyqtSlot(int)
     def jump_to_character(self, char_index):
         """Scroll canvas to show specific character."""
         if not self.canvas.image:
             return
         
-        y_pos = char_index * self.canvas.char_height * self.canvas.zoom_level
-        self.canvas_scroll.verticalScrollBar().setValue(y_pos)
+        # Coalesce rapid jumps: only the latest target is applied
+        if self._pending_scroll is None:
+            QTimer.singleShot(0, self._apply_pending_scroll)
+        self._pending_scroll = char_index * self.canvas.char_height * self.canvas.zoom_level
+    
+    def _apply_pending_scroll(self):
+        """Apply the most recent scroll target queued by jump_to_character."""
+        if self._pending_scroll is not None:
+            self.canvas_scroll.verticalScrollBar().setValue(self._pending_scroll)
+            self._pending_scroll = None
     
     def scroll_to_character(self, char_index):
         """Handle character jump signal from canvas."""
@@ -1153,9 +1422,7 @@ class MonkeyIslandFontEditor(QMainWindow):
         # Update button states
         if mode == 'draw':
             self.draw_mode_btn.setChecked(True)
-            self.select_mode_btn.setChecked(False)
         elif mode == 'select':
-            self.draw_mode_btn.setChecked(False)
             self.select_mode_btn.setChecked(True)
     
     def clear_selection_action(self):
@@ -1166,33 +1433,23 @@ class MonkeyIslandFontEditor(QMainWindow):
     def copy_selection(self):
         """Copy selected region."""
         if self.canvas.copy_selection():
-            QMessageBox.information(
-                self,
-                "Copied",
+            self._flash(
                 f"Selection copied to clipboard ({self.canvas.clipboard_size[0]}x{self.canvas.clipboard_size[1]} pixels)"
             )
             self.canvas.clear_selection()
         else:
-            QMessageBox.warning(
-                self,
-                "No Selection",
-                "Please hold Shift and drag to select a region first."
-            )
+            self._flash("No selection: hold Shift and drag to select a region first.")
     
     def paste_selection(self):
         """Enter paste mode."""
         if self.canvas.start_paste_mode():
             self.commit_btn.setEnabled(True)
             self.cancel_btn.setEnabled(True)
-            self.info_label.setText(
-                f"{self.info_label.text()} | PASTE MODE: Drag to position, then click Commit or Cancel"
+            self._set_info_text(
+                f"{self._base_info_text} | PASTE MODE: Drag to position, then click Commit or Cancel"
             )
         else:
-            QMessageBox.warning(
-                self,
-                "No Clipboard",
-                "Please copy a selection first."
-            )
+            self._flash("Nothing to paste: copy a selection first.")
     
     def commit_paste(self):
         """Commit the paste operation."""
@@ -1201,14 +1458,7 @@ class MonkeyIslandFontEditor(QMainWindow):
             self.cancel_btn.setEnabled(False)
             self.update_undo_redo_buttons()
             # Restore info label
-            if self.canvas.image:
-                num_chars = self.canvas.image.height() // self.canvas.char_height
-                self.info_label.setText(
-                    f"Editing: {Path(self.current_file).name} | "
-                    f"Char Height: {self.canvas.char_height}px | "
-                    f"Contains {num_chars} characters (ASCII 0-{num_chars-1}) | "
-                    f"Hover over canvas to see character indices"
-                )
+            self._set_info_text(self._base_info_text)
     
     def cancel_paste(self):
         """Cancel the paste operation."""
@@ -1216,14 +1466,7 @@ class MonkeyIslandFontEditor(QMainWindow):
         self.commit_btn.setEnabled(False)
         self.cancel_btn.setEnabled(False)
         # Restore info label
-        if self.canvas.image:
-            num_chars = self.canvas.image.height() // self.canvas.char_height
-            self.info_label.setText(
-                f"Editing: {Path(self.current_file).name} | "
-                f"Char Height: {self.canvas.char_height}px | "
-                f"Contains {num_chars} characters (ASCII 0-{num_chars-1}) | "
-                f"Hover over canvas to see character indices"
-            )
+        self._set_info_text(self._base_info_text)
     
     def undo_action(self):
         """Undo the last action."""
@@ -1231,7 +1474,7 @@ class MonkeyIslandFontEditor(QMainWindow):
             self.update_undo_redo_buttons()
         else:
             if self.canvas.can_undo():
-                QMessageBox.information(self, "Undo", "Cannot undo: state mismatch")
+                self._flash("Cannot undo: state mismatch")
     
     def redo_action(self):
         """Redo the last undone action."""
@@ -1239,16 +1482,43 @@ class MonkeyIslandFontEditor(QMainWindow):
             self.update_undo_redo_buttons()
         else:
             if self.canvas.can_redo():
-                QMessageBox.information(self, "Redo", "Cannot redo: state mismatch")
+                self._flash("Cannot redo: state mismatch")
+    
+    def _set_info_text(self, text):
+        """Set the info label text, cancelling any transient message."""
+        self._flash_active = False
+        self.info_label.setText(text)
+    
+    def _flash(self, message, timeout=2000):
+        """Show a non-modal status message in the info label, then restore its text."""
+        if not self._flash_active:
+            self._flash_saved_text = self.info_label.text()
+            self._flash_active = True
+        self._flash_serial += 1
+        self.info_label.setText(message)
+        QTimer.singleShot(timeout, functools.partial(self._end_flash, self._flash_serial))
+    
+    def _end_flash(self, serial):
+        """Restore the info label if no newer message or text replaced the flash."""
+        if self._flash_active and serial == self._flash_serial:
+            self._set_info_text(self._flash_saved_text)
     
     def update_undo_redo_buttons(self):
         """Update undo/redo button states."""
-        self.undo_btn.setEnabled(self.canvas.can_undo())
-        self.redo_btn.setEnabled(self.canvas.can_redo())
+        can_undo = self.canvas.can_undo()
+        if can_undo != self._undo_state:
+            self.undo_btn.setEnabled(can_undo)
+            self._undo_state = can_undo
+        can_redo = self.canvas.can_redo()
+        if can_redo != self._redo_state:
+            self.redo_btn.setEnabled(can_redo)
+            self._redo_state = can_redo
     
     def update_selection_buttons(self, has_selection):
         """Update selection-related button states."""
-        self.clear_sel_btn.setEnabled(has_selection)
+        if has_selection != self._clear_sel_state:
+            self.clear_sel_btn.setEnabled(has_selection)
+            self._clear_sel_state = has_selection
     
     def save_current(self):
         """Save the currently edited character."""
@@ -1263,8 +1533,6 @@ class MonkeyIslandFontEditor(QMainWindow):
                     "Saved",
                     f"Character #{self.current_index} saved successfully!"
                 )
-                # Refresh thumbnail
-                self.load_workspace()
             else:
                 raise Exception("Save failed")
         except Exception as e:
@@ -1279,6 +1547,7 @@ def main():
     """Main entry point."""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Modern cross-platform style
+    app.setStyleSheet(APP_STYLE)
     
     window = MonkeyIslandFontEditor()
     window.show()